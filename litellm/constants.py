@@ -770,6 +770,24 @@ BEDROCK_AGENT_RUNTIME_PASS_THROUGH_ROUTES = [
     "optimize-prompt/",
 ]
 BASE_MCP_ROUTE = "/mcp"
+MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS", 100)
+)  # max idle connections kept open by the connection pool shared by MCP http/sse clients
+MCP_HTTP_KEEPALIVE_EXPIRY_SECONDS = float(
+    os.getenv("MCP_HTTP_KEEPALIVE_EXPIRY_SECONDS", 60)
+)
+MCP_TOOL_NAME_LRU_CACHE_SIZE = int(
+    os.getenv("MCP_TOOL_NAME_LRU_CACHE_SIZE", 4096)
+)  # cached prefixed/unprefixed MCP tool names
+MAX_MCP_SERVER_CONCURRENT_REQUESTS = int(
+    os.getenv("MAX_MCP_SERVER_CONCURRENT_REQUESTS", 16)
+)  # max upstream MCP servers queried concurrently when listing tools
+MAX_MCP_CLIENT_POOL_SIZE = int(
+    os.getenv("MAX_MCP_CLIENT_POOL_SIZE", 64)
+)  # max connected MCP clients kept for reuse across tool calls
+MCP_CLIENT_POOL_IDLE_TTL_SECONDS = float(
+    os.getenv("MCP_CLIENT_POOL_IDLE_TTL_SECONDS", 300)
+)  # pooled MCP clients unused for this long are disconnected
 
 BATCH_STATUS_POLL_INTERVAL_SECONDS = int(
     os.getenv("BATCH_STATUS_POLL_INTERVAL_SECONDS", 3600)
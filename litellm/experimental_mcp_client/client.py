@@ -4,8 +4,9 @@ LiteLLM Proxy uses this MCP Client to connnect to other MCP servers.
 import asyncio
 import base64
 from datetime import timedelta
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+import httpx
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
@@ -44,6 +45,8 @@ class MCPClient:
         auth_value: Optional[str] = None,
         timeout: float = 60.0,
         stdio_config: Optional[MCPStdioConfig] = None,
+        httpx_client_factory: Optional[Callable[..., httpx.AsyncClient]] = None,
+        disconnect_on_error: bool = True,
     ):
         self.server_url: str = server_url
         self.transport_type: MCPTransport = transport_type
@@ -57,6 +60,11 @@ class MCPClient:
         self._session_ctx = None
         self._task: Optional[asyncio.Task] = None
         self.stdio_config: Optional[MCPStdioConfig] = stdio_config
+        self.httpx_client_factory: Optional[
+            Callable[..., httpx.AsyncClient]
+        ] = httpx_client_factory
+        # Clients owned by a connection pool leave disconnecting to the task that connected them
+        self.disconnect_on_error: bool = disconnect_on_error
 
         # handle the basic auth value if provided
         if auth_value:
@@ -102,6 +110,7 @@ class MCPClient:
                     url=self.server_url,
                     timeout=self.timeout,
                     headers=headers,
+                    **self._get_httpx_client_factory_kwargs(),
                 )
                 self._transport = await self._transport_ctx.__aenter__()
                 self._session_ctx = ClientSession(self._transport[0], self._transport[1])
@@ -113,6 +122,7 @@ class MCPClient:
                     url=self.server_url,
                     timeout=timedelta(seconds=self.timeout),
                     headers=headers,
+                    **self._get_httpx_client_factory_kwargs(),
                 )
                 self._transport = await self._transport_ctx.__aenter__()
                 self._session_ctx = ClientSession(self._transport[0], self._transport[1])
@@ -167,6 +177,14 @@ class MCPClient:
             mcp_auth_value = to_basic_auth(mcp_auth_value)
         self._mcp_auth_value = mcp_auth_value
 
+    def _get_httpx_client_factory_kwargs(self) -> Dict[str, Any]:
+        """
+        Only pass `httpx_client_factory` when set, so the mcp library default is used otherwise.
+        """
+        if self.httpx_client_factory is None:
+            return {}
+        return {"httpx_client_factory": self.httpx_client_factory}
+
     def _get_auth_headers(self) -> dict:
         """Generate authentication headers based on auth type."""
         if not self._mcp_auth_value:
@@ -191,10 +209,12 @@ class MCPClient:
             result = await self._session.list_tools()
             return result.tools
         except asyncio.CancelledError:
-            await self.disconnect()
+            if self.disconnect_on_error:
+                await self.disconnect()
             raise
         except Exception:
-            await self.disconnect()
+            if self.disconnect_on_error:
+                await self.disconnect()
             raise
 
     async def call_tool(
@@ -216,10 +236,12 @@ class MCPClient:
             )
             return tool_result
         except asyncio.CancelledError:
-            await self.disconnect()
+            if self.disconnect_on_error:
+                await self.disconnect()
             raise
         except Exception:
-            await self.disconnect()
+            if self.disconnect_on_error:
+                await self.disconnect()
             raise
         
 
@@ -9,17 +9,33 @@ This is a Proxy
 import asyncio
 import hashlib
 import json
-from typing import Any, Dict, List, Optional, cast
-
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
+
+import httpx
+import orjson
+from httpx._utils import get_environment_proxies
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
 from mcp.types import CallToolRequestParams as MCPCallToolRequestParams
 from mcp.types import CallToolResult
 from mcp.types import Tool as MCPTool
 
+import litellm
 from litellm._logging import verbose_logger
+from litellm.constants import (
+    MAX_MCP_CLIENT_POOL_SIZE,
+    MAX_MCP_SERVER_CONCURRENT_REQUESTS,
+    MCP_CLIENT_POOL_IDLE_TTL_SECONDS,
+    MCP_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
 from litellm.experimental_mcp_client.client import MCPClient
 from litellm.proxy._experimental.mcp_server.auth.user_api_key_auth_mcp import (
     MCPRequestHandler,
 )
+from litellm.proxy._experimental.mcp_server.db import get_all_mcp_servers
 from litellm.proxy._experimental.mcp_server.utils import (
     add_server_prefix_to_tool_name,
     get_server_name_prefix_tool_mcp,
@@ -36,6 +52,7 @@ from litellm.proxy._types import (
     MCPTransportType,
     UserAPIKeyAuth,
 )
+from litellm.proxy.utils import get_prisma_client_or_throw
 from litellm.types.mcp import MCPStdioConfig
 from litellm.types.mcp_server.mcp_server_manager import MCPInfo, MCPServer
 
@@ -53,19 +70,124 @@ def _deserialize_env_dict(env_data: Any) -> Optional[Dict[str, str]]:
     """
     if not env_data:
         return None
-        
+
+    if isinstance(env_data, dict):
+        # Already a dictionary
+        return env_data
+
     if isinstance(env_data, str):
         try:
-            return json.loads(env_data)
-        except (json.JSONDecodeError, TypeError):
+            # Use orjson to parse JSON data, orjson is significantly faster than json.loads
+            return orjson.loads(env_data)
+        except (orjson.JSONDecodeError, TypeError):
             # If it's not valid JSON, return as-is (shouldn't happen but safety)
             return None
-    else:
-        # Already a dictionary
-        return env_data
+
+    return env_data
+
+
+class _SharedAsyncHTTPTransport(httpx.AsyncHTTPTransport):
+    """
+    httpx transport shared by all MCP http/sse clients.
+
+    The mcp library closes its httpx.AsyncClient when a session ends, which would
+    also close the transport. Closing is a no-op here; the pool is closed via `close_pool`.
+    """
+
+    async def __aenter__(self) -> "_SharedAsyncHTTPTransport":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    async def close_pool(self) -> None:
+        await super().aclose()
+
+
+class _PooledMCPClient:
+    """
+    A connected MCPClient kept for reuse across `call_tool` invocations.
+
+    The mcp transports and session are anyio task groups, which must be exited by the
+    task that entered them. So the client is connected and disconnected by one owner task,
+    and request tasks only ever use the session - they never connect or disconnect it.
+    """
+
+    def __init__(self, client: MCPClient):
+        self.client = client
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.stale = False
+        """
+        Set when a call fails on this session - the next caller rebuilds it
+        """
+        self.evicted = False
+        """
+        Set once removed from the pool - disconnects when the last in-flight call finishes
+        """
+        self._connected = asyncio.Event()
+        self._close_requested = asyncio.Event()
+        self._connect_error: Optional[Exception] = None
+        self._owner_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """
+        Start the owner task and wait until the client is connected
+        """
+        self._owner_task = asyncio.create_task(self._run())
+        await self._connected.wait()
+        if self._connect_error is not None:
+            raise self._connect_error
+        if self._owner_task.done():
+            raise RuntimeError("MCP client closed before it finished connecting")
+
+    async def _run(self) -> None:
+        try:
+            try:
+                await self.client.connect()
+            except Exception as e:
+                self._connect_error = e
+                return
+            finally:
+                self._connected.set()
+            await self._close_requested.wait()
+        finally:
+            await self.client.disconnect()
+
+    @property
+    def is_usable(self) -> bool:
+        return (
+            self._owner_task is not None
+            and not self._owner_task.done()
+            and not self._close_requested.is_set()
+            and not self.stale
+        )
+
+    def request_close(self) -> None:
+        """
+        Ask the owner task to disconnect the client. Safe to call from any task.
+        """
+        self._close_requested.set()
+
+    async def aclose(self) -> None:
+        """
+        Disconnect the client and wait for the owner task to finish
+        """
+        self.request_close()
+        if self._owner_task is not None:
+            await asyncio.wait([self._owner_task])
 
 
 class MCPServerManager:
+    _has_stdio_fields_by_row_type: Dict[type, bool] = {}
+    """
+    Whether a DB row type exposes the stdio fields (`command`, `args`, `env`).
+    Older Prisma model objects may not have them.
+    """
+
     def __init__(self):
         self.registry: Dict[str, MCPServer] = {}
         self.config_mcp_servers: Dict[str, MCPServer] = {}
@@ -86,6 +208,20 @@ class MCPServerManager:
         ]
         """
 
+        self._merged_registry: Dict[str, MCPServer] = {}
+        """
+        Cached union of `config_mcp_servers` and `registry` (registry entries take precedence).
+        Kept in sync via `_sync_merged_registry` whenever either dict is updated.
+        """
+
+        self._by_normalized_name: Dict[str, MCPServer] = {}
+        """
+        Index of the merged registry keyed by `server.normalized_name`
+        {
+            "zapier_mcp_server": MCPServer(...),
+        }
+        """
+
         self.tool_name_to_mcp_server_name_mapping: Dict[str, str] = {}
         """
         {
@@ -93,11 +229,92 @@ class MCPServerManager:
         }
         """
 
+        self._client_pool: Dict[Tuple[str, str], _PooledMCPClient] = {}
+        self._client_pool_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        """
+        Connected MCP clients reused across `call_tool` invocations, least recently used first.
+        Keyed by (server_id, hash of the mcp auth header).
+        """
+
+        self._client_pool_sweep_handle: Optional[asyncio.TimerHandle] = None
+        """
+        Timer that disconnects idle pooled clients once traffic stops
+        """
+
+        self._registry_content_hashes: Dict[str, str] = {}
+        """
+        Content hash of the DB row each `registry` entry was built from, keyed by server_id.
+        Lets repeated DB refreshes skip rebuilding unchanged servers.
+        """
+
+        self._shared_http_transport: Optional[_SharedAsyncHTTPTransport] = None
+        """
+        Connection pool shared by all http/sse MCP clients, created on first use
+        """
+
+        self._shared_http_proxy_mounts: Optional[
+            Dict[str, Optional[_SharedAsyncHTTPTransport]]
+        ] = None
+        """
+        Shared connection pools for the HTTP(S)_PROXY / NO_PROXY env settings, keyed by url pattern.
+        A None value means the pattern bypasses the proxy and uses `_shared_http_transport`.
+        """
+
     def get_registry(self) -> Dict[str, MCPServer]:
         """
         Get the registered MCP Servers from the registry and union with the config MCP Servers
+
+        Returns the cached dict itself - copy it before iterating across an await.
+        """
+        return self._merged_registry
+
+    def _sync_merged_registry(self, server_id: str) -> None:
+        """
+        Refresh the cached merged registry entry for a single server id.
+
+        Registry entries override config entries, matching `config_mcp_servers | registry`.
+        Also keeps the normalized server name index up to date - the first server
+        in merged registry order wins a name, same as a linear scan would.
+        """
+        previous_server = self._merged_registry.get(server_id)
+        server = self.registry.get(server_id) or self.config_mcp_servers.get(server_id)
+        if server is None:
+            self._merged_registry.pop(server_id, None)
+        else:
+            self._merged_registry[server_id] = server
+
+        if previous_server is None:
+            if server is not None:
+                # a new id is appended last, so it only claims a name nobody holds yet
+                self._by_normalized_name.setdefault(server.normalized_name, server)
+        elif previous_server is not server:
+            # replaced or removed in place - recompute the winner for the affected names
+            names_to_reindex = {previous_server.normalized_name}
+            if server is not None:
+                names_to_reindex.add(server.normalized_name)
+            for normalized_name in names_to_reindex:
+                self._reindex_normalized_name(normalized_name)
+
+    def _reindex_normalized_name(self, normalized_name: str) -> None:
+        """
+        Point a normalized name at the first matching server in merged registry order.
+        """
+        for server in self._merged_registry.values():
+            if server.normalized_name == normalized_name:
+                self._by_normalized_name[normalized_name] = server
+                return
+        self._by_normalized_name.pop(normalized_name, None)
+
+    def _rebuild_merged_registry(self) -> None:
         """
-        return self.config_mcp_servers | self.registry
+        Rebuild the merged registry and name index from scratch.
+
+        Use this after `registry` or `config_mcp_servers` are replaced wholesale.
+        """
+        self._merged_registry = self.config_mcp_servers | self.registry
+        self._by_normalized_name = {}
+        for server in self._merged_registry.values():
+            self._by_normalized_name.setdefault(server.normalized_name, server)
 
     def load_servers_from_config(self, mcp_servers_config: Dict[str, Any]):
         """
@@ -134,9 +351,13 @@ class MCPServerManager:
                 mcp_info=mcp_info,
             )
             self.config_mcp_servers[server_id] = new_server
-        verbose_logger.debug(
-            f"Loaded MCP Servers: {json.dumps(self.config_mcp_servers, indent=4, default=str)}"
-        )
+        # rebuild so config servers keep their place ahead of DB servers
+        self._rebuild_merged_registry()
+        # Only serialize the servers when debug logging is on
+        if verbose_logger.isEnabledFor(logging.DEBUG):
+            verbose_logger.debug(
+                f"Loaded MCP Servers: {json.dumps(self.config_mcp_servers, indent=4, default=str)}"
+            )
 
         self.initialize_tool_name_to_mcp_server_name_mapping()
 
@@ -146,45 +367,144 @@ class MCPServerManager:
         """
         if mcp_server.alias in self.get_registry():
             del self.registry[mcp_server.alias]
+            self._registry_content_hashes.pop(mcp_server.alias, None)
+            self._sync_merged_registry(mcp_server.alias)
+            self._evict_pooled_mcp_clients(mcp_server.alias)
             verbose_logger.debug(f"Removed MCP Server: {mcp_server.alias}")
         elif mcp_server.server_id in self.get_registry():
             del self.registry[mcp_server.server_id]
+            self._registry_content_hashes.pop(mcp_server.server_id, None)
+            self._sync_merged_registry(mcp_server.server_id)
+            self._evict_pooled_mcp_clients(mcp_server.server_id)
             verbose_logger.debug(f"Removed MCP Server: {mcp_server.server_id}")
         else:
             verbose_logger.warning(
                 f"Server ID {mcp_server.server_id} not found in registry"
             )
 
-    def add_update_server(self, mcp_server: LiteLLM_MCPServerTable):
-        if mcp_server.server_id not in self.get_registry():
-            _mcp_info: MCPInfo = mcp_server.mcp_info or {}
-            
+    def _build_mcp_server_from_table(
+        self, mcp_server: LiteLLM_MCPServerTable
+    ) -> MCPServer:
+        """
+        Build the in-memory MCPServer for a LiteLLM_MCPServerTable row
+        """
+        _mcp_info: MCPInfo = mcp_server.mcp_info or {}
+
+        # Stdio fields may not exist on Prisma model objects
+        command: Optional[str] = None
+        args: List[str] = []
+        env_dict: Optional[Dict[str, str]] = None
+        if self._has_stdio_fields(mcp_server):
+            command = mcp_server.command
+            args = mcp_server.args or []
             # Use helper to deserialize environment dictionary
-            # Safely access env field which may not exist on Prisma model objects
-            env_data = getattr(mcp_server, 'env', None)
-            env_dict = _deserialize_env_dict(env_data)
-            
-            new_server = MCPServer(
-                server_id=mcp_server.server_id,
-                name=mcp_server.alias or mcp_server.server_id,
-                url=mcp_server.url,
-                transport=cast(MCPTransportType, mcp_server.transport),
-                spec_version=cast(MCPSpecVersionType, mcp_server.spec_version),
-                auth_type=cast(MCPAuthType, mcp_server.auth_type),
-                mcp_info=MCPInfo(
-                    server_name=mcp_server.alias or mcp_server.server_id,
-                    description=mcp_server.description,
-                    mcp_server_cost_info=_mcp_info.get("mcp_server_cost_info", None),
-                ),
-                # Stdio-specific fields
-                command=getattr(mcp_server, 'command', None),
-                args=getattr(mcp_server, 'args', None) or [],
-                env=env_dict,
+            env_dict = _deserialize_env_dict(mcp_server.env)
+
+        return MCPServer(
+            server_id=mcp_server.server_id,
+            name=mcp_server.alias or mcp_server.server_id,
+            url=mcp_server.url,
+            transport=cast(MCPTransportType, mcp_server.transport),
+            spec_version=cast(MCPSpecVersionType, mcp_server.spec_version),
+            auth_type=cast(MCPAuthType, mcp_server.auth_type),
+            mcp_info=MCPInfo(
+                server_name=mcp_server.alias or mcp_server.server_id,
+                description=mcp_server.description,
+                mcp_server_cost_info=_mcp_info.get("mcp_server_cost_info", None),
+            ),
+            # Stdio-specific fields
+            command=command,
+            args=args,
+            env=env_dict,
+        )
+
+    @classmethod
+    def _has_stdio_fields(cls, mcp_server: LiteLLM_MCPServerTable) -> bool:
+        """
+        Check whether the row has the stdio fields, probing once per row type
+        """
+        row_type = type(mcp_server)
+        has_stdio_fields = cls._has_stdio_fields_by_row_type.get(row_type)
+        if has_stdio_fields is None:
+            has_stdio_fields = all(
+                hasattr(mcp_server, field) for field in ("command", "args", "env")
             )
-            self.registry[mcp_server.server_id] = new_server
-            verbose_logger.debug(
-                f"Added MCP Server: {mcp_server.alias or mcp_server.server_id}"
+            cls._has_stdio_fields_by_row_type[row_type] = has_stdio_fields
+        return has_stdio_fields
+
+    def _get_mcp_server_table_content_hash(
+        self, mcp_server: LiteLLM_MCPServerTable
+    ) -> str:
+        """
+        Hash the fields of a DB row that `_build_mcp_server_from_table` reads
+        """
+        content = (
+            f"{mcp_server.alias}|{mcp_server.description}|{mcp_server.url}|"
+            f"{mcp_server.transport}|{mcp_server.spec_version}|{mcp_server.auth_type}|"
+            f"{mcp_server.mcp_info}"
+        )
+        if self._has_stdio_fields(mcp_server):
+            content += f"|{mcp_server.command}|{mcp_server.args}|{mcp_server.env}"
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _should_build_server(self, server_id: str, content_hash: str) -> bool:
+        """
+        Whether a DB row needs to be (re)built into the registry.
+
+        - New servers are built
+        - DB servers are rebuilt only if their content changed
+        - Config servers are never overridden by DB rows
+        """
+        if server_id in self.registry:
+            return self._registry_content_hashes.get(server_id) != content_hash
+        return server_id not in self.config_mcp_servers
+
+    def add_update_server(self, mcp_server: LiteLLM_MCPServerTable):
+        content_hash = self._get_mcp_server_table_content_hash(mcp_server)
+        if not self._should_build_server(mcp_server.server_id, content_hash):
+            return
+
+        is_update = mcp_server.server_id in self.registry
+        new_server = self._build_mcp_server_from_table(mcp_server)
+        self.registry[mcp_server.server_id] = new_server
+        self._registry_content_hashes[mcp_server.server_id] = content_hash
+        self._sync_merged_registry(mcp_server.server_id)
+        if is_update:
+            # connection settings may have changed, drop clients for the old config
+            self._evict_pooled_mcp_clients(mcp_server.server_id)
+        verbose_logger.debug(
+            f"{'Updated' if is_update else 'Added'} MCP Server: {mcp_server.alias or mcp_server.server_id}"
+        )
+
+    def add_servers(self, mcp_servers: Iterable[LiteLLM_MCPServerTable]):
+        """
+        Add multiple servers to the registry, merging them in a single update.
+
+        Same rules as `add_update_server` - unchanged servers are skipped, changed DB servers are rebuilt.
+        """
+        new_servers: Dict[str, MCPServer] = {}
+        new_content_hashes: Dict[str, str] = {}
+        for mcp_server in mcp_servers:
+            if mcp_server.server_id in new_servers:
+                continue
+            content_hash = self._get_mcp_server_table_content_hash(mcp_server)
+            if not self._should_build_server(mcp_server.server_id, content_hash):
+                continue
+            new_servers[mcp_server.server_id] = self._build_mcp_server_from_table(
+                mcp_server
             )
+            new_content_hashes[mcp_server.server_id] = content_hash
+
+        updated_server_ids = [
+            server_id for server_id in new_servers if server_id in self.registry
+        ]
+        self.registry.update(new_servers)
+        self._registry_content_hashes.update(new_content_hashes)
+        for server_id in new_servers:
+            self._sync_merged_registry(server_id)
+        for server_id in updated_server_ids:
+            self._evict_pooled_mcp_clients(server_id)
+        verbose_logger.debug(f"Added/updated MCP Servers: {list(new_servers.keys())}")
 
     async def get_allowed_mcp_servers(
         self, user_api_key_auth: Optional[UserAPIKeyAuth] = None
@@ -192,6 +512,10 @@ class MCPServerManager:
         """
         Get the allowed MCP Servers for the user
         """
+        if user_api_key_auth is None:
+            # MCPRequestHandler returns no servers without an auth object, so skip the lookup
+            return list(self.get_registry().keys())
+
         allowed_mcp_servers = await MCPRequestHandler.get_allowed_mcp_servers(
             user_api_key_auth
         )
@@ -229,38 +553,56 @@ class MCPServerManager:
             List[MCPTool]: Combined list of tools from all servers
         """
         allowed_mcp_servers = await self.get_allowed_mcp_servers(user_api_key_auth)
+        # Deduplicate while preserving order, so each upstream server is only queried once
+        unique_mcp_server_ids = list(dict.fromkeys(allowed_mcp_servers))
 
-        list_tools_result: List[MCPTool] = []
         verbose_logger.debug("SERVER MANAGER LISTING TOOLS")
 
-        for server_id in allowed_mcp_servers:
+        # Query upstream servers concurrently, bounded to avoid opening too many connections at once
+        semaphore = asyncio.Semaphore(MAX_MCP_SERVER_CONCURRENT_REQUESTS)
+
+        async def _list_tools_for_server(server_id: str) -> List[MCPTool]:
             server = self.get_mcp_server_by_id(server_id)
             if server is None:
                 verbose_logger.warning(f"MCP Server {server_id} not found")
-                continue
-            try:
-                tools = await self._get_tools_from_server(
-                    server=server,
-                    mcp_auth_header=mcp_auth_header,
-                )
-                list_tools_result.extend(tools)
-            except Exception as e:
-                verbose_logger.exception(
-                    f"Error listing tools from server {server.name}: {str(e)}"
-                )
+                return []
+            async with semaphore:
+                try:
+                    return await self._get_tools_from_server(
+                        server=server,
+                        mcp_auth_header=mcp_auth_header,
+                    )
+                except Exception as e:
+                    verbose_logger.exception(
+                        f"Error listing tools from server {server.name}: {str(e)}"
+                    )
+                    return []
 
+        results = await asyncio.gather(
+            *(_list_tools_for_server(server_id) for server_id in unique_mcp_server_ids)
+        )
+
+        list_tools_result: List[MCPTool] = [
+            tool for server_tools in results for tool in server_tools
+        ]
         return list_tools_result
 
     #########################################################
     # Methods that call the upstream MCP servers
     #########################################################
-    def _create_mcp_client(self, server: MCPServer, mcp_auth_header: Optional[str] = None) -> MCPClient:
+    def _create_mcp_client(
+        self,
+        server: MCPServer,
+        mcp_auth_header: Optional[str] = None,
+        disconnect_on_error: bool = True,
+    ) -> MCPClient:
         """
         Create an MCPClient instance for the given server.
 
         Args:
             server (MCPServer): The server configuration
             mcp_auth_header: MCP auth header to be passed to the MCP server. This is optional and will be used if provided.
+            disconnect_on_error: Whether the client disconnects itself when a call fails. Pooled clients set this to False.
 
         Returns:
             MCPClient: Configured MCP client instance
@@ -269,15 +611,9 @@ class MCPServerManager:
         
         # Handle stdio transport
         if transport == MCPTransport.stdio:
-            # For stdio, we need to get the stdio config from the server
-            stdio_config: Optional[MCPStdioConfig] = None
-            if server.command and server.args is not None:
-                stdio_config = MCPStdioConfig(
-                    command=server.command,
-                    args=server.args,
-                    env=server.env or {}
-                )
-            
+            # For stdio, use the stdio config precomputed on the server
+            stdio_config: Optional[MCPStdioConfig] = server.stdio_config
+
             return MCPClient(
                 server_url="",  # Not used for stdio
                 transport_type=transport,
@@ -285,6 +621,7 @@ class MCPServerManager:
                 auth_value=mcp_auth_header or server.authentication_token,
                 timeout=60.0,
                 stdio_config=stdio_config,
+                disconnect_on_error=disconnect_on_error,
             )
         else:
             # For HTTP/SSE transports
@@ -295,8 +632,230 @@ class MCPServerManager:
                 auth_type=server.auth_type,
                 auth_value=mcp_auth_header or server.authentication_token,
                 timeout=60.0,
+                httpx_client_factory=self._create_mcp_http_client,
+                disconnect_on_error=disconnect_on_error,
             )
 
+    def _build_shared_http_transport(
+        self, proxy: Optional[httpx.Proxy] = None
+    ) -> _SharedAsyncHTTPTransport:
+        """
+        Only idle connections are limited - pooled sse/http clients hold a stream open for
+        their whole lifetime, so a cap on open connections would starve new clients.
+        """
+        return _SharedAsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=None,
+                max_keepalive_connections=MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=MCP_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            local_address="0.0.0.0" if litellm.force_ipv4 else None,
+            proxy=proxy,
+        )
+
+    def _get_shared_http_transport(self) -> _SharedAsyncHTTPTransport:
+        """
+        Get the connection pool shared by MCP http/sse clients, creating it on first use
+        """
+        if self._shared_http_transport is None:
+            self._shared_http_transport = self._build_shared_http_transport()
+        return self._shared_http_transport
+
+    def _get_shared_http_proxy_mounts(
+        self,
+    ) -> Dict[str, Optional[_SharedAsyncHTTPTransport]]:
+        """
+        Get the shared proxy connection pools for the env proxy settings, creating them on first use.
+
+        httpx skips env proxies when a client is given an explicit transport,
+        so they are passed as mounts instead - same as the mcp library default client would use.
+        """
+        if self._shared_http_proxy_mounts is None:
+            self._shared_http_proxy_mounts = {
+                key: None
+                if url is None
+                else self._build_shared_http_transport(proxy=httpx.Proxy(url=url))
+                for key, url in get_environment_proxies().items()
+            }
+        return self._shared_http_proxy_mounts
+
+    def _create_mcp_http_client(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        auth: Optional[httpx.Auth] = None,
+    ) -> httpx.AsyncClient:
+        """
+        httpx client factory passed to the mcp library for http/sse transports.
+
+        Mirrors the mcp library default client, but every client shares one connection pool
+        (one per env proxy) instead of opening its own.
+        """
+        return httpx.AsyncClient(
+            transport=self._get_shared_http_transport(),
+            mounts=self._get_shared_http_proxy_mounts(),
+            headers=headers,
+            timeout=timeout if timeout is not None else httpx.Timeout(30.0),
+            auth=auth,
+            follow_redirects=True,
+        )
+
+    async def close(self) -> None:
+        """
+        Disconnect pooled MCP clients and close the shared http connection pools.
+
+        Called on proxy shutdown.
+        """
+        if self._client_pool_sweep_handle is not None:
+            self._client_pool_sweep_handle.cancel()
+            self._client_pool_sweep_handle = None
+        pooled_clients = list(self._client_pool.values())
+        self._client_pool.clear()
+        self._client_pool_locks.clear()
+        # each owner task disconnects its own client
+        await asyncio.gather(*(pooled.aclose() for pooled in pooled_clients))
+
+        shared_http_transports = list((self._shared_http_proxy_mounts or {}).values())
+        shared_http_transports.append(self._shared_http_transport)
+        self._shared_http_transport = None
+        self._shared_http_proxy_mounts = None
+        for shared_http_transport in shared_http_transports:
+            if shared_http_transport is not None:
+                await shared_http_transport.close_pool()
+
+    def _get_client_pool_key(
+        self, server: MCPServer, mcp_auth_header: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Build the client pool key for a server + auth header pair.
+
+        The auth header is hashed so raw credentials are not kept as dict keys.
+        Stdio servers never send auth headers, so they share one client (and subprocess) per server.
+        """
+        if server.transport == MCPTransport.stdio:
+            return (server.server_id, "")
+        auth_header_hash = hashlib.blake2b(
+            (mcp_auth_header or "").encode("utf-8"), digest_size=8
+        ).hexdigest()
+        return (server.server_id, auth_header_hash)
+
+    async def _acquire_pooled_mcp_client(
+        self, server: MCPServer, mcp_auth_header: Optional[str] = None
+    ) -> Tuple[_PooledMCPClient, bool]:
+        """
+        Get a connected pooled client for the server, connecting a new one on first use
+        or when the pooled one went stale.
+
+        Every acquire must be paired with `_release_pooled_mcp_client`.
+
+        Returns:
+            Tuple[_PooledMCPClient, bool]: the pooled client, and whether it was connected for this call
+        """
+        key = self._get_client_pool_key(server=server, mcp_auth_header=mcp_auth_header)
+        is_new_session = False
+        pooled = self._client_pool.get(key)
+        if pooled is None or not pooled.is_usable:
+            lock = self._client_pool_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                pooled = self._client_pool.get(key)
+                if pooled is None or not pooled.is_usable:
+                    self._retire_pooled_mcp_client(key)
+                    pooled = _PooledMCPClient(
+                        self._create_mcp_client(
+                            server=server,
+                            mcp_auth_header=mcp_auth_header,
+                            disconnect_on_error=False,
+                        )
+                    )
+                    try:
+                        await pooled.start()
+                    except BaseException:
+                        pooled.request_close()
+                        raise
+                    self._retire_pooled_mcp_client(key)
+                    self._client_pool[key] = pooled
+                    is_new_session = True
+
+        # move to the most recently used end
+        self._client_pool[key] = self._client_pool.pop(key)
+        pooled.in_use += 1
+        pooled.last_used = time.monotonic()
+        self._evict_unused_pooled_mcp_clients()
+        return pooled, is_new_session
+
+    def _release_pooled_mcp_client(self, pooled: _PooledMCPClient) -> None:
+        pooled.in_use -= 1
+        pooled.last_used = time.monotonic()
+        if pooled.in_use == 0 and (pooled.evicted or pooled.stale):
+            pooled.request_close()
+        self._schedule_pooled_mcp_client_sweep()
+
+    def _retire_pooled_mcp_client(self, key: Tuple[str, str]) -> None:
+        """
+        Remove a pooled client - it disconnects once no call is using it
+        """
+        lock = self._client_pool_locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._client_pool_locks[key]
+        pooled = self._client_pool.pop(key, None)
+        if pooled is None:
+            return
+        pooled.evicted = True
+        if pooled.in_use == 0:
+            pooled.request_close()
+
+    def _evict_unused_pooled_mcp_clients(self) -> None:
+        """
+        Keep the pool bounded - drop idle clients past the TTL, then the least recently used over the size limit
+        """
+        now = time.monotonic()
+        idle_keys = [
+            key
+            for key, pooled in self._client_pool.items()
+            if pooled.in_use == 0
+            and now - pooled.last_used >= MCP_CLIENT_POOL_IDLE_TTL_SECONDS
+        ]
+        for key in idle_keys:
+            self._retire_pooled_mcp_client(key)
+        while len(self._client_pool) > MAX_MCP_CLIENT_POOL_SIZE:
+            self._retire_pooled_mcp_client(next(iter(self._client_pool)))
+
+    def _schedule_pooled_mcp_client_sweep(self) -> None:
+        """
+        Schedule the idle client sweep for when the longest idle pooled client hits the TTL
+        """
+        if self._client_pool_sweep_handle is not None or not self._client_pool:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # no running event loop
+            return
+        idle_since = [
+            pooled.last_used for pooled in self._client_pool.values() if pooled.in_use == 0
+        ]
+        # busy clients are rescheduled when they are released
+        delay = (
+            min(idle_since) + MCP_CLIENT_POOL_IDLE_TTL_SECONDS - time.monotonic()
+            if idle_since
+            else MCP_CLIENT_POOL_IDLE_TTL_SECONDS
+        )
+        self._client_pool_sweep_handle = loop.call_later(
+            max(delay, 0), self._sweep_pooled_mcp_clients
+        )
+
+    def _sweep_pooled_mcp_clients(self) -> None:
+        self._client_pool_sweep_handle = None
+        self._evict_unused_pooled_mcp_clients()
+        self._schedule_pooled_mcp_client_sweep()
+
+    def _evict_pooled_mcp_clients(self, server_id: str) -> None:
+        """
+        Remove pooled clients for a server, e.g. after it was updated or removed
+        """
+        keys = [key for key in self._client_pool if key[0] == server_id]
+        for key in keys:
+            self._retire_pooled_mcp_client(key)
+
     async def _get_tools_from_server(self, server: MCPServer, mcp_auth_header: Optional[str] = None) -> List[MCPTool]:
         """
         Helper method to get tools from a single MCP server with prefixed names.
@@ -318,41 +877,36 @@ class MCPServerManager:
                 mcp_auth_header=mcp_auth_header,
             )
 
-            # Create a task for the client operations to ensure proper cancellation handling
-            async def _list_tools_task():
-                async with client:
-                    tools = await client.list_tools()
-                    verbose_logger.debug(f"Tools from {server.name}: {tools}")
-                    return tools
+            async with client:
+                tools = await client.list_tools()
+                verbose_logger.debug(f"Tools from {server.name}: {tools}")
 
-            try:
-                tools = await _list_tools_task()
-
-                # Create new tools with prefixed names
-                prefixed_tools = []
-                for tool in tools:
-                    # Create prefixed tool name
-                    prefixed_name = add_server_prefix_to_tool_name(tool.name, server.name)
-
-                    # Create new tool with prefixed name
-                    prefixed_tool = MCPTool(
-                        name=prefixed_name,
-                        description=tool.description,
-                        inputSchema=tool.inputSchema
-                    )
-                    prefixed_tools.append(prefixed_tool)
+            # Create new tools with prefixed names
+            prefixed_tools = []
+            tool_name_to_server_name: Dict[str, str] = {}
+            for tool in tools:
+                # Create prefixed tool name
+                prefixed_name = add_server_prefix_to_tool_name(tool.name, server.name)
+
+                # Create new tool with prefixed name
+                prefixed_tool = MCPTool(
+                    name=prefixed_name,
+                    description=tool.description,
+                    inputSchema=tool.inputSchema
+                )
+                prefixed_tools.append(prefixed_tool)
 
-                    # Update tool to server mapping with both original and prefixed names
-                    self.tool_name_to_mcp_server_name_mapping[tool.name] = server.name
-                    self.tool_name_to_mcp_server_name_mapping[prefixed_name] = server.name
+                # Track both original and prefixed names for the tool to server mapping
+                tool_name_to_server_name[tool.name] = server.name
+                tool_name_to_server_name[prefixed_name] = server.name
 
-                return prefixed_tools
-            except asyncio.CancelledError:
-                verbose_logger.warning(f"Task cancelled while listing tools from {server.name}")
-                raise  # Re-raise the cancellation
-            except Exception as e:
-                verbose_logger.exception(f"Error listing tools from {server.name}: {str(e)}")
-                raise
+            # Merge into the shared mapping once per server
+            self.tool_name_to_mcp_server_name_mapping.update(tool_name_to_server_name)
+
+            return prefixed_tools
+        except asyncio.CancelledError:
+            verbose_logger.warning(f"Task cancelled while listing tools from {server.name}")
+            raise  # Re-raise the cancellation
         except Exception as e:
             verbose_logger.exception(f"Failed to get tools from server {server.name}: {str(e)}")
             return []  # Return empty list on failure
@@ -391,21 +945,66 @@ class MCPServerManager:
             raise ValueError(f"Tool {name} not found")
 
         # Validate that the server from prefix matches the actual server (if prefix was used)
-        if server_name_from_prefix and normalize_server_name(server_name_from_prefix) != normalize_server_name(mcp_server.name):
+        if server_name_from_prefix and normalize_server_name(server_name_from_prefix) != mcp_server.normalized_name:
             raise ValueError(
                 f"Tool {name} server prefix mismatch: expected {mcp_server.name}, got {server_name_from_prefix}")
 
-        client = self._create_mcp_client(
+        # Use the original tool name (without prefix) for the actual call
+        call_tool_params = MCPCallToolRequestParams(
+            name=original_tool_name,
+            arguments=arguments,
+        )
+        return await self._call_tool_on_pooled_client(
             server=mcp_server,
+            call_tool_params=call_tool_params,
+            mcp_auth_header=mcp_auth_header,
+        )
+
+    async def _call_tool_on_pooled_client(
+        self,
+        server: MCPServer,
+        call_tool_params: MCPCallToolRequestParams,
+        mcp_auth_header: Optional[str] = None,
+        retry_closed_session: bool = True,
+    ) -> CallToolResult:
+        """
+        Call a tool on a pooled client, avoiding the transport + session handshake per call.
+
+        If a reused session turns out to be closed (e.g. the upstream restarted), retries once on a new session.
+        """
+        pooled, is_new_session = await self._acquire_pooled_mcp_client(
+            server=server,
             mcp_auth_header=mcp_auth_header,
         )
-        async with client:
-            # Use the original tool name (without prefix) for the actual call
-            call_tool_params = MCPCallToolRequestParams(
-                name=original_tool_name,
-                arguments=arguments,
+        try:
+            return await pooled.client.call_tool(call_tool_params)
+        except Exception as e:
+            if not self._is_mcp_session_closed_error(e):
+                raise
+            # don't tear down a session other calls may be using - the next caller rebuilds it
+            pooled.stale = True
+            if is_new_session or not retry_closed_session:
+                raise
+            verbose_logger.debug(
+                f"Pooled MCP session for {server.name} is closed, retrying on a new session: {str(e)}"
             )
-            return await client.call_tool(call_tool_params)
+        finally:
+            self._release_pooled_mcp_client(pooled)
+        return await self._call_tool_on_pooled_client(
+            server=server,
+            call_tool_params=call_tool_params,
+            mcp_auth_header=mcp_auth_header,
+            retry_closed_session=False,
+        )
+
+    @staticmethod
+    def _is_mcp_session_closed_error(error: Exception) -> bool:
+        """
+        Whether a call failed because the session is unusable, rather than the server rejecting the call
+        """
+        if isinstance(error, McpError):
+            return error.error.code == CONNECTION_CLOSED
+        return True
 
     #########################################################
     # End of Methods that call the upstream MCP servers
@@ -431,14 +1030,25 @@ class MCPServerManager:
         Call list_tools for each server and update the tool name to MCP server name mapping
         Note: This now handles prefixed tool names
         """
-        for server in self.get_registry().values():
-            tools = await self._get_tools_from_server(server)
+        servers = list(self.get_registry().values())
+        semaphore = asyncio.Semaphore(MAX_MCP_SERVER_CONCURRENT_REQUESTS)
+
+        async def _list_tools_for_server(server: MCPServer) -> List[MCPTool]:
+            async with semaphore:
+                return await self._get_tools_from_server(server)
+
+        results = await asyncio.gather(
+            *(_list_tools_for_server(server) for server in servers)
+        )
+        for server, tools in zip(servers, results):
+            tool_name_to_server_name: Dict[str, str] = {}
             for tool in tools:
                 # The tool.name here is already prefixed from _get_tools_from_server
                 # Extract original name for mapping
                 original_name, _ = get_server_name_prefix_tool_mcp(tool.name)
-                self.tool_name_to_mcp_server_name_mapping[original_name] = server.name
-                self.tool_name_to_mcp_server_name_mapping[tool.name] = server.name
+                tool_name_to_server_name[original_name] = server.name
+                tool_name_to_server_name[tool.name] = server.name
+            self.tool_name_to_mcp_server_name_mapping.update(tool_name_to_server_name)
 
     def _get_mcp_server_from_tool_name(self, tool_name: str) -> Optional[MCPServer]:
         """
@@ -451,44 +1061,35 @@ class MCPServerManager:
             MCPServer if found, None otherwise
         """
         # First try with the original tool name
-        if tool_name in self.tool_name_to_mcp_server_name_mapping:
-            server_name = self.tool_name_to_mcp_server_name_mapping[tool_name]
-            for server in self.get_registry().values():
-                if normalize_server_name(server.name) == normalize_server_name(server_name):
-                    return server
+        server_name = self.tool_name_to_mcp_server_name_mapping.get(tool_name)
+        if server_name is not None:
+            server = self._by_normalized_name.get(normalize_server_name(server_name))
+            if server is not None:
+                return server
 
         # If not found and tool name is prefixed, try extracting server name from prefix
         if is_tool_name_prefixed(tool_name):
             _, server_name_from_prefix = get_server_name_prefix_tool_mcp(tool_name)
-            for server in self.get_registry().values():
-                if normalize_server_name(server.name) == normalize_server_name(server_name_from_prefix):
-                    return server
+            return self._by_normalized_name.get(
+                normalize_server_name(server_name_from_prefix)
+            )
 
         return None
 
     async def _add_mcp_servers_from_db_to_in_memory_registry(self):
-        from litellm.proxy._experimental.mcp_server.db import get_all_mcp_servers
-        from litellm.proxy.management_endpoints.mcp_management_endpoints import (
-            get_prisma_client_or_throw,
-        )
-
         # perform authz check to filter the mcp servers user has access to
         prisma_client = get_prisma_client_or_throw(
             "Database not connected. Connect a database to your proxy"
         )
         db_mcp_servers = await get_all_mcp_servers(prisma_client)
         # ensure the global_mcp_server_manager is up to date with the db
-        for server in db_mcp_servers:
-            self.add_update_server(server)
+        self.add_servers(db_mcp_servers)
 
     def get_mcp_server_by_id(self, server_id: str) -> Optional[MCPServer]:
         """
         Get the MCP Server from the server id
         """
-        for server in self.get_registry().values():
-            if server.server_id == server_id:
-                return server
-        return None
+        return self._merged_registry.get(server_id)
 
     def _generate_stable_server_id(
         self,
@@ -521,12 +1122,11 @@ class MCPServerManager:
             f"{server_name}|{url}|{transport}|{spec_version}|{auth_type or ''}"
         )
 
-        # Generate SHA-256 hash
-        hash_object = hashlib.sha256(params_string.encode("utf-8"))
-        hash_hex = hash_object.hexdigest()
+        # Generate SHA-256 hash. Do not swap the hash function - existing keys reference these ids.
+        hash_digest = hashlib.sha256(params_string.encode("utf-8")).digest()
 
-        # Take first 32 characters and format as UUID-like string
-        return hash_hex[:32]
+        # Hex-encode only the first 16 bytes, equal to the first 32 characters of the hexdigest
+        return hash_digest[:16].hex()
 
 
 global_mcp_server_manager: MCPServerManager = MCPServerManager()
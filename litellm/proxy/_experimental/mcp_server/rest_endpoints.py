@@ -95,7 +95,8 @@ if MCP_AVAILABLE:
             else:
                 # Query all servers
                 errors = []
-                for server in global_mcp_server_manager.get_registry().values():
+                # snapshot the registry, it can change while awaiting upstream servers
+                for server in list(global_mcp_server_manager.get_registry().values()):
                     try:
                         tools = await global_mcp_server_manager._get_tools_from_server(
                             server=server,
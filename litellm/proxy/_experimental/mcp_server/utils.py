@@ -1,10 +1,13 @@
 """
 MCP Server Utilities
 """
+from functools import lru_cache
 from typing import Tuple
 
 import importlib
 
+from litellm.constants import MCP_TOOL_NAME_LRU_CACHE_SIZE
+
 # Constants
 LITELLM_MCP_SERVER_NAME = "litellm-mcp-server"
 LITELLM_MCP_SERVER_VERSION = "1.0.0"
@@ -28,6 +31,7 @@ def normalize_server_name(server_name: str) -> str:
     """
     return server_name.replace(" ", "_")
 
+@lru_cache(maxsize=MCP_TOOL_NAME_LRU_CACHE_SIZE)
 def add_server_prefix_to_tool_name(tool_name: str, server_name: str) -> str:
     """
     Add server name prefix to tool name
@@ -47,6 +51,7 @@ def add_server_prefix_to_tool_name(tool_name: str, server_name: str) -> str:
         tool_name=tool_name
     )
 
+@lru_cache(maxsize=MCP_TOOL_NAME_LRU_CACHE_SIZE)
 def get_server_name_prefix_tool_mcp(prefixed_tool_name: str) -> Tuple[str, str]:
     """
     Remove server name prefix from tool name
@@ -516,6 +516,20 @@ async def proxy_shutdown_event():
     if db_writer_client is not None:
         await db_writer_client.close()
 
+    # close pooled MCP clients + shared http connection pool
+    from litellm.proxy._experimental.mcp_server.utils import is_mcp_available
+
+    if is_mcp_available():
+        try:
+            from litellm.proxy._experimental.mcp_server.mcp_server_manager import (
+                global_mcp_server_manager,
+            )
+
+            await global_mcp_server_manager.close()
+        except Exception:
+            # [DO NOT BLOCK shutdown events for this]
+            pass
+
     # flush remaining langfuse logs
     if "langfuse" in litellm.success_callback:
         try:
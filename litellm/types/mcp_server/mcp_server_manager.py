@@ -1,10 +1,11 @@
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 
-from pydantic import BaseModel, ConfigDict
-from typing_extensions import TypedDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from typing_extensions import Self, TypedDict
 
+from litellm.proxy._experimental.mcp_server.utils import normalize_server_name
 from litellm.proxy._types import MCPAuthType, MCPSpecVersionType, MCPTransportType
-from litellm.types.mcp import MCPServerCostInfo
+from litellm.types.mcp import MCPServerCostInfo, MCPStdioConfig, MCPTransport
 
 
 class MCPInfo(TypedDict, total=False):
@@ -14,6 +15,9 @@ class MCPInfo(TypedDict, total=False):
     mcp_server_cost_info: Optional[MCPServerCostInfo]
 
 
+_DERIVED_FIELD_SOURCE_FIELDS = {"name", "transport", "command", "args", "env"}
+
+
 class MCPServer(BaseModel):
     server_id: str
     name: str
@@ -28,3 +32,53 @@ class MCPServer(BaseModel):
     args: Optional[List[str]] = None
     env: Optional[Dict[str, str]] = None
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Cached derived fields
+    _normalized_name: str = PrivateAttr(default="")
+    _stdio_config: Optional[MCPStdioConfig] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._refresh_derived_fields()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _DERIVED_FIELD_SOURCE_FIELDS:
+            self._refresh_derived_fields()
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        # private attrs are copied as-is, so recompute them for the updated fields
+        copied = super().model_copy(update=update, deep=deep)
+        copied._refresh_derived_fields()
+        return copied
+
+    def _refresh_derived_fields(self) -> None:
+        self._normalized_name = normalize_server_name(self.name)
+        if (
+            self.transport == MCPTransport.stdio
+            and self.command
+            and self.args is not None
+        ):
+            self._stdio_config = MCPStdioConfig(
+                command=self.command,
+                args=self.args,
+                env=self.env or {},
+            )
+        else:
+            self._stdio_config = None
+
+    @property
+    def normalized_name(self) -> str:
+        """
+        Server name normalized via `normalize_server_name`, kept in sync with `name`
+        """
+        return self._normalized_name
+
+    @property
+    def stdio_config(self) -> Optional[MCPStdioConfig]:
+        """
+        Stdio config used to launch the server, kept in sync with `command` / `args` / `env`.
+
+        None for non-stdio transports or when `command` / `args` are not set.
+        """
+        return self._stdio_config
@@ -75,7 +75,9 @@ async def test_mcp_server_manager_https_server():
     def mock_client_constructor(*args, **kwargs):
         return mock_client
     
-    with patch('litellm.proxy._experimental.mcp_server.mcp_server_manager.MCPClient', mock_client_constructor):
+    # Skip the background tool name mapping task so the mocked client only sees the calls below
+    with patch('litellm.proxy._experimental.mcp_server.mcp_server_manager.MCPClient', mock_client_constructor), \
+            patch.object(mcp_server_manager, "initialize_tool_name_to_mcp_server_name_mapping"):
         mcp_server_manager.load_servers_from_config(
             {
                 "zapier_mcp_server": {
@@ -161,7 +163,9 @@ async def test_mcp_http_transport_list_tools_mock():
     def mock_client_constructor(*args, **kwargs):
         return mock_client
     
-    with patch('litellm.proxy._experimental.mcp_server.mcp_server_manager.MCPClient', mock_client_constructor):
+    # Skip the background tool name mapping task so the mocked client only sees the calls below
+    with patch('litellm.proxy._experimental.mcp_server.mcp_server_manager.MCPClient', mock_client_constructor), \
+            patch.object(test_manager, "initialize_tool_name_to_mcp_server_name_mapping"):
         
         # Load server config with HTTP transport
         test_manager.load_servers_from_config({
@@ -598,6 +602,7 @@ async def test_list_tools_rest_api_success():
         global_mcp_server_manager.tool_name_to_mcp_server_name_mapping.clear()
         global_mcp_server_manager.registry.clear()
         global_mcp_server_manager.config_mcp_servers.clear()
+        global_mcp_server_manager._rebuild_merged_registry()
         
         # Mock successful tools
         mock_tools = [
@@ -645,6 +650,7 @@ async def test_list_tools_rest_api_success():
         # Restore original state
         global_mcp_server_manager.registry = {}
         global_mcp_server_manager.config_mcp_servers = original_registry
+        global_mcp_server_manager._rebuild_merged_registry()
         global_mcp_server_manager.tool_name_to_mcp_server_name_mapping = original_tool_mapping
 
 
@@ -1,7 +1,11 @@
+import asyncio
+import os
 import sys
+from contextlib import AsyncExitStack
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 # Add the parent directory to the path so we can import litellm
@@ -66,6 +70,508 @@ class TestMCPServerManager:
         assert added_server.args == ["-m", "server"]
         assert added_server.env == {"DEBUG": "1", "TEST": "1"}
 
+    def test_get_registry_registry_overrides_config(self):
+        """Test cached merged registry keeps registry precedence over config servers"""
+        manager = MCPServerManager()
+        manager.load_servers_from_config(
+            {"config_server": {"url": "https://config.example.com/mcp"}}
+        )
+        server_id = list(manager.config_mcp_servers.keys())[0]
+        assert manager.get_registry()[server_id].name == "config_server"
+
+        db_server = LiteLLM_MCPServerTable(
+            server_id=server_id,
+            alias="db_server",
+            url="https://db.example.com/mcp",
+            transport=MCPTransport.http,
+            spec_version=MCPSpecVersion.mar_2025,
+            created_at=datetime.now(),
+            updated_at=datetime.now()
+        )
+        manager.add_update_server(db_server)
+        # config entry already exists under this id, so add_update_server is a no-op
+        assert manager.get_registry()[server_id].name == "config_server"
+
+        other_db_server = db_server.model_copy(update={"server_id": "db-server-2"})
+        manager.add_update_server(other_db_server)
+        assert manager.get_mcp_server_by_id("db-server-2").name == "db_server"
+
+        manager.remove_server(other_db_server)
+        assert "db-server-2" not in manager.get_registry()
+        assert server_id in manager.get_registry()
+
+    def test_add_servers_bulk(self):
+        """Test bulk adding DB servers skips duplicates and updates lookups"""
+        manager = MCPServerManager()
+        db_servers = [
+            LiteLLM_MCPServerTable(
+                server_id=f"bulk-server-{i}",
+                alias=f"bulk_server_{i}",
+                url=f"https://bulk{i}.example.com/mcp",
+                transport=MCPTransport.http,
+                spec_version=MCPSpecVersion.mar_2025,
+            )
+            for i in range(3)
+        ]
+        duplicate = db_servers[0].model_copy(update={"alias": "duplicate_alias"})
+
+        manager.add_servers(db_servers + [duplicate])
+
+        assert list(manager.registry.keys()) == ["bulk-server-0", "bulk-server-1", "bulk-server-2"]
+        assert manager.get_mcp_server_by_id("bulk-server-0").name == "bulk_server_0"
+        assert manager._get_mcp_server_from_tool_name("bulk_server_2-tool").server_id == "bulk-server-2"
+
+    def test_add_update_server_skips_unchanged_and_rebuilds_changed(self):
+        """Test re-adding an unchanged DB row is a no-op and a changed row replaces the server"""
+        manager = MCPServerManager()
+        db_server = LiteLLM_MCPServerTable(
+            server_id="db-server-1",
+            alias="db_server",
+            url="https://db.example.com/mcp",
+            transport=MCPTransport.http,
+            spec_version=MCPSpecVersion.mar_2025,
+        )
+        manager.add_update_server(db_server)
+        original_server = manager.registry["db-server-1"]
+
+        manager.add_update_server(db_server.model_copy())
+        assert manager.registry["db-server-1"] is original_server
+
+        manager.add_servers([db_server.model_copy()])
+        assert manager.registry["db-server-1"] is original_server
+
+        updated_db_server = db_server.model_copy(
+            update={"alias": "renamed_server", "url": "https://new.example.com/mcp"}
+        )
+        manager.add_update_server(updated_db_server)
+        updated_server = manager.get_mcp_server_by_id("db-server-1")
+        assert updated_server is not original_server
+        assert updated_server.name == "renamed_server"
+        assert updated_server.url == "https://new.example.com/mcp"
+        assert manager._get_mcp_server_from_tool_name("renamed_server-tool") is updated_server
+        assert manager._get_mcp_server_from_tool_name("db_server-tool") is None
+
+    @pytest.mark.asyncio
+    async def test_get_allowed_mcp_servers_without_auth(self):
+        """Test no auth object returns all registry servers without an auth lookup"""
+        manager = MCPServerManager()
+        manager.load_servers_from_config(
+            {"my_server": {"url": "https://example.com/mcp"}}
+        )
+
+        with patch(
+            "litellm.proxy._experimental.mcp_server.mcp_server_manager.MCPRequestHandler.get_allowed_mcp_servers",
+            new_callable=AsyncMock,
+        ) as mock_get_allowed:
+            result = await manager.get_allowed_mcp_servers(None)
+
+        assert result == list(manager.config_mcp_servers.keys())
+        mock_get_allowed.assert_not_called()
+
+    def test_get_mcp_server_from_tool_name(self):
+        """Test tool name lookup via the normalized server name index"""
+        manager = MCPServerManager()
+        manager.load_servers_from_config(
+            {"my_server": {"url": "https://example.com/mcp"}}
+        )
+        server_id = list(manager.config_mcp_servers.keys())[0]
+        manager.tool_name_to_mcp_server_name_mapping["send_email"] = "my_server"
+
+        assert manager._get_mcp_server_from_tool_name("send_email").server_id == server_id
+        assert manager._get_mcp_server_from_tool_name("my_server-other_tool").server_id == server_id
+        assert manager._get_mcp_server_from_tool_name("unknown_tool") is None
+        assert manager._get_mcp_server_from_tool_name("unknown_server-tool") is None
+
+        # a stale mapping entry still resolves through the tool name prefix
+        manager.tool_name_to_mcp_server_name_mapping["my_server-stale_tool"] = "removed_server"
+        assert manager._get_mcp_server_from_tool_name("my_server-stale_tool").server_id == server_id
+
+    def test_get_mcp_server_from_tool_name_name_collision(self):
+        """Test a config server keeps its name when a DB server shares it, also after the DB row is removed"""
+        manager = MCPServerManager()
+        db_server = LiteLLM_MCPServerTable(
+            server_id="db-shared-1",
+            alias="shared",
+            url="https://db.example.com/mcp",
+            transport=MCPTransport.http,
+            spec_version=MCPSpecVersion.mar_2025,
+        )
+        manager.add_update_server(db_server)
+        assert manager._get_mcp_server_from_tool_name("shared-tool").server_id == "db-shared-1"
+
+        manager.load_servers_from_config({"shared": {"url": "https://config.example.com/mcp"}})
+        config_server_id = list(manager.config_mcp_servers.keys())[0]
+        assert manager._get_mcp_server_from_tool_name("shared-tool").server_id == config_server_id
+
+        other_db_server = db_server.model_copy(update={"server_id": "db-shared-2"})
+        manager.add_update_server(other_db_server)
+        assert manager._get_mcp_server_from_tool_name("shared-tool").server_id == config_server_id
+
+        manager.remove_server(db_server)
+        manager.remove_server(other_db_server)
+        assert manager._get_mcp_server_from_tool_name("shared-tool").server_id == config_server_id
+
+    def test_mcp_server_normalized_name(self):
+        """Test normalized server name is derived from the server name"""
+        server = MCPServer(
+            server_id="server-1",
+            name="my server",
+            transport=MCPTransport.http,
+            spec_version=MCPSpecVersion.mar_2025,
+        )
+        assert server.normalized_name == "my_server"
+
+        # stays in sync when the name changes on a copy or in place
+        assert server.model_copy(update={"name": "other server"}).normalized_name == "other_server"
+        assert server.normalized_name == "my_server"
+        server.name = "renamed server"
+        assert server.normalized_name == "renamed_server"
+
+    @pytest.mark.asyncio
+    async def test_list_tools_combines_servers_concurrently(self):
+        """Test list_tools queries each allowed server once and skips unknown ones"""
+        manager = MCPServerManager()
+        # keep the background tool name mapping task from calling the mocked server lookup
+        with patch.object(manager, "initialize_tool_name_to_mcp_server_name_mapping"):
+            manager.load_servers_from_config(
+                {
+                    "server_a": {"url": "https://a.example.com/mcp"},
+                    "server_b": {"url": "https://b.example.com/mcp"},
+                }
+            )
+        server_ids = list(manager.config_mcp_servers.keys())
+
+        async def _mock_get_tools_from_server(server, mcp_auth_header=None):
+            tool = MagicMock()
+            tool.name = f"{server.name}-tool"
+            return [tool]
+
+        manager._get_tools_from_server = AsyncMock(side_effect=_mock_get_tools_from_server)
+        manager.get_allowed_mcp_servers = AsyncMock(
+            return_value=server_ids + ["missing-server"] + server_ids
+        )
+
+        tools = await manager.list_tools()
+
+        assert [tool.name for tool in tools] == ["server_a-tool", "server_b-tool"]
+        # duplicate allowed ids are collapsed into one lookup per server
+        awaited_server_ids = [
+            call.kwargs["server"].server_id
+            for call in manager._get_tools_from_server.await_args_list
+        ]
+        assert sorted(awaited_server_ids) == sorted(server_ids)
+
+    @pytest.mark.asyncio
+    async def test_call_tool_reuses_pooled_client(self):
+        """Test call_tool reuses a connected client per server and auth header"""
+        manager = MCPServerManager()
+        db_server = LiteLLM_MCPServerTable(
+            server_id="pooled-server-1",
+            alias="pooled_server",
+            url="https://pooled.example.com/mcp",
+            transport=MCPTransport.http,
+            spec_version=MCPSpecVersion.mar_2025,
+            created_at=datetime.now(),
+            updated_at=datetime.now()
+        )
+        manager.add_update_server(db_server)
+
+        mock_client = AsyncMock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.call_tool = AsyncMock(return_value="result")
+        manager._create_mcp_client = MagicMock(return_value=mock_client)
+
+        for _ in range(2):
+            result = await manager.call_tool(
+                name="pooled_server-some_tool", arguments={}
+            )
+            assert result == "result"
+        assert manager._create_mcp_client.call_count == 1
+        assert mock_client.call_tool.call_count == 2
+
+        await manager.call_tool(
+            name="pooled_server-some_tool", arguments={}, mcp_auth_header="token"
+        )
+        assert manager._create_mcp_client.call_count == 2
+
+        manager.remove_server(db_server)
+        assert manager._client_pool == {}
+
+    @pytest.mark.asyncio
+    async def test_pooled_client_lifecycle_runs_in_owner_task(self):
+        """Test a failed call marks the pooled client stale instead of disconnecting it from the caller"""
+        manager = MCPServerManager()
+        manager.add_update_server(
+            LiteLLM_MCPServerTable(
+                server_id="pooled-server-1",
+                alias="pooled_server",
+                url="https://pooled.example.com/mcp",
+                transport=MCPTransport.http,
+                spec_version=MCPSpecVersion.mar_2025,
+            )
+        )
+
+        def _mock_client(call_tool_side_effect):
+            mock_client = AsyncMock()
+            mock_client.tasks = {}
+            mock_client.connect = AsyncMock(
+                side_effect=lambda: mock_client.tasks.setdefault("connect", asyncio.current_task())
+            )
+            mock_client.disconnect = AsyncMock(
+                side_effect=lambda: mock_client.tasks.setdefault("disconnect", asyncio.current_task())
+            )
+            mock_client.call_tool = AsyncMock(side_effect=call_tool_side_effect)
+            return mock_client
+
+        failing_client = _mock_client(RuntimeError("connection reset"))
+        healthy_client = _mock_client(["result"])
+        manager._create_mcp_client = MagicMock(side_effect=[failing_client, healthy_client])
+
+        with pytest.raises(RuntimeError):
+            await manager.call_tool(name="pooled_server-some_tool", arguments={})
+        await asyncio.sleep(0)
+        # the owner task disconnects, never the request task
+        assert failing_client.tasks["disconnect"] is failing_client.tasks["connect"]
+        assert failing_client.tasks["connect"] is not asyncio.current_task()
+
+        result = await manager.call_tool(name="pooled_server-some_tool", arguments={})
+        assert result == "result"
+        assert manager._create_mcp_client.call_count == 2
+
+        await manager.close()
+        assert healthy_client.tasks["disconnect"] is healthy_client.tasks["connect"]
+        assert manager._client_pool == {}
+
+    @pytest.mark.asyncio
+    async def test_call_tool_retries_closed_pooled_session(self):
+        """Test a reused session that died is retried once on a new one, while server errors are not"""
+        from mcp.shared.exceptions import McpError
+        from mcp.types import CONNECTION_CLOSED, INVALID_PARAMS, ErrorData
+
+        manager = MCPServerManager()
+        manager.add_update_server(
+            LiteLLM_MCPServerTable(
+                server_id="pooled-server-1",
+                alias="pooled_server",
+                url="https://pooled.example.com/mcp",
+                transport=MCPTransport.http,
+                spec_version=MCPSpecVersion.mar_2025,
+            )
+        )
+        restarted_client, new_client = AsyncMock(), AsyncMock()
+        restarted_client.call_tool = AsyncMock(
+            side_effect=[
+                "result",
+                McpError(ErrorData(code=CONNECTION_CLOSED, message="Connection closed")),
+            ]
+        )
+        new_client.call_tool = AsyncMock(
+            side_effect=[
+                "retried result",
+                McpError(ErrorData(code=INVALID_PARAMS, message="Invalid params")),
+            ]
+        )
+        manager._create_mcp_client = MagicMock(side_effect=[restarted_client, new_client])
+
+        assert await manager.call_tool(name="pooled_server-some_tool", arguments={}) == "result"
+        # the upstream went away under the pooled session
+        assert await manager.call_tool(name="pooled_server-some_tool", arguments={}) == "retried result"
+        assert manager._create_mcp_client.call_count == 2
+
+        with pytest.raises(McpError):
+            await manager.call_tool(name="pooled_server-some_tool", arguments={})
+        assert new_client.call_tool.call_count == 2
+        assert manager._create_mcp_client.call_count == 2
+        await manager.close()
+
+    def test_get_client_pool_key_ignores_auth_header_for_stdio(self):
+        """Test stdio servers get one pooled client regardless of the mcp auth header"""
+        manager = MCPServerManager()
+        stdio_server = MCPServer(
+            server_id="stdio-server-1",
+            name="stdio_server",
+            transport=MCPTransport.stdio,
+            spec_version=MCPSpecVersion.mar_2025,
+            command="python",
+            args=["server.py"],
+        )
+        http_server = MCPServer(
+            server_id="http-server-1",
+            name="http_server",
+            url="https://example.com/mcp",
+            transport=MCPTransport.http,
+            spec_version=MCPSpecVersion.mar_2025,
+        )
+
+        assert manager._get_client_pool_key(stdio_server, "a") == manager._get_client_pool_key(stdio_server, "b")
+        assert manager._get_client_pool_key(http_server, "a") != manager._get_client_pool_key(http_server, "b")
+
+    @pytest.mark.asyncio
+    async def test_client_pool_evicts_least_recently_used(self):
+        """Test the client pool stays bounded by disconnecting the least recently used client"""
+        manager = MCPServerManager()
+        manager.add_update_server(
+            LiteLLM_MCPServerTable(
+                server_id="pooled-server-1",
+                alias="pooled_server",
+                url="https://pooled.example.com/mcp",
+                transport=MCPTransport.http,
+                spec_version=MCPSpecVersion.mar_2025,
+            )
+        )
+        first_client, second_client = AsyncMock(), AsyncMock()
+        manager._create_mcp_client = MagicMock(side_effect=[first_client, second_client])
+
+        with patch(
+            "litellm.proxy._experimental.mcp_server.mcp_server_manager.MAX_MCP_CLIENT_POOL_SIZE",
+            1,
+        ):
+            await manager.call_tool(name="pooled_server-some_tool", arguments={}, mcp_auth_header="a")
+            await manager.call_tool(name="pooled_server-some_tool", arguments={}, mcp_auth_header="b")
+        await asyncio.sleep(0)
+
+        assert len(manager._client_pool) == 1
+        first_client.disconnect.assert_awaited()
+        second_client.disconnect.assert_not_awaited()
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_client_pool_sweeps_idle_clients_without_traffic(self):
+        """Test idle pooled clients are disconnected after the TTL even when no further calls arrive"""
+        manager = MCPServerManager()
+        manager.add_update_server(
+            LiteLLM_MCPServerTable(
+                server_id="pooled-server-1",
+                alias="pooled_server",
+                url="https://pooled.example.com/mcp",
+                transport=MCPTransport.http,
+                spec_version=MCPSpecVersion.mar_2025,
+            )
+        )
+        mock_client = AsyncMock()
+        manager._create_mcp_client = MagicMock(return_value=mock_client)
+
+        with patch(
+            "litellm.proxy._experimental.mcp_server.mcp_server_manager.MCP_CLIENT_POOL_IDLE_TTL_SECONDS",
+            0.01,
+        ):
+            await manager.call_tool(name="pooled_server-some_tool", arguments={})
+            assert len(manager._client_pool) == 1
+            await asyncio.sleep(0.1)
+
+        assert manager._client_pool == {}
+        mock_client.disconnect.assert_awaited()
+        assert manager._client_pool_sweep_handle is None
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_mcp_http_clients_share_connection_pool(self):
+        """Test http/sse MCP clients share one transport that outlives each httpx client"""
+        manager = MCPServerManager()
+        http_server = MCPServer(
+            server_id="http-server-1",
+            name="http_server",
+            url="https://example.com/mcp",
+            transport=MCPTransport.http,
+            spec_version=MCPSpecVersion.mar_2025,
+        )
+        client = manager._create_mcp_client(http_server)
+        assert client.httpx_client_factory is not None
+
+        first_httpx_client = client.httpx_client_factory(headers={"X-API-Key": "a"})
+        second_httpx_client = client.httpx_client_factory(headers={"X-API-Key": "b"})
+        assert first_httpx_client._transport is second_httpx_client._transport
+
+        # closing a client (done by the mcp library when a session ends) keeps the pool open
+        async with first_httpx_client:
+            pass
+        assert manager._shared_http_transport is second_httpx_client._transport
+
+        await manager.close()
+        assert manager._shared_http_transport is None
+
+    @pytest.mark.asyncio
+    async def test_mcp_http_clients_respect_env_proxies(self):
+        """Test the shared connection pool still routes through HTTPS_PROXY and honours NO_PROXY"""
+        manager = MCPServerManager()
+        with patch.dict(
+            os.environ,
+            {"HTTPS_PROXY": "http://proxy.example.com:3128", "NO_PROXY": "internal.example.com"},
+        ):
+            first_httpx_client = manager._create_mcp_http_client()
+            second_httpx_client = manager._create_mcp_http_client(headers={"X-API-Key": "b"})
+
+        proxy_transport = first_httpx_client._transport_for_url(httpx.URL("https://example.com/mcp"))
+        assert proxy_transport is not first_httpx_client._transport
+        # proxied clients share one proxy connection pool too
+        assert proxy_transport is second_httpx_client._transport_for_url(
+            httpx.URL("https://example.com/mcp")
+        )
+        assert (
+            first_httpx_client._transport_for_url(httpx.URL("https://internal.example.com/mcp"))
+            is first_httpx_client._transport
+        )
+
+        await manager.close()
+        assert manager._shared_http_proxy_mounts is None
+
+    @pytest.mark.asyncio
+    async def test_mcp_http_connection_pool_does_not_cap_open_streams(self):
+        """Test held sse/http streams beyond the keepalive limit don't block new requests"""
+        release_streams = asyncio.Event()
+
+        async def _handle_stream(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nTransfer-Encoding: chunked\r\n\r\n"
+            )
+            await writer.drain()
+            await release_streams.wait()
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(_handle_stream, "127.0.0.1", 0)
+        url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/sse"
+        manager = MCPServerManager()
+        try:
+            with patch(
+                "litellm.proxy._experimental.mcp_server.mcp_server_manager.MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+                1,
+            ):
+                async with AsyncExitStack() as stack:
+                    # one long-lived stream per pooled client, more than the keepalive limit
+                    for i in range(3):
+                        httpx_client = manager._create_mcp_http_client(headers={"X-API-Key": str(i)})
+                        response = await asyncio.wait_for(
+                            stack.enter_async_context(httpx_client.stream("GET", url)),
+                            timeout=5,
+                        )
+                        assert response.status_code == 200
+                    release_streams.set()
+        finally:
+            release_streams.set()
+            await manager.close()
+            server.close()
+            await server.wait_closed()
+
+    def test_generate_stable_server_id_is_backwards_compatible(self):
+        """Test server ids stay identical to the original sha256 hexdigest[:32] ids"""
+        import hashlib
+
+        manager = MCPServerManager()
+        server_id = manager._generate_stable_server_id(
+            server_name="zapier_mcp_server",
+            url="https://example.com/mcp",
+            transport="http",
+            spec_version="2025-03-26",
+            auth_type="api_key",
+        )
+        expected = hashlib.sha256(
+            "zapier_mcp_server|https://example.com/mcp|http|2025-03-26|api_key".encode("utf-8")
+        ).hexdigest()[:32]
+        assert server_id == expected
+
     def test_create_mcp_client_stdio(self):
         """Test creating MCP client for stdio transport"""
         manager = MCPServerManager()
@@ -89,6 +595,17 @@ class TestMCPServerManager:
         assert client.stdio_config["args"] == ["server.js"]
         assert client.stdio_config["env"] == {"NODE_ENV": "test"}
 
+        # stdio config is built once and shared across clients for the same server
+        assert manager._create_mcp_client(stdio_server).stdio_config is client.stdio_config
+
+        # a copy with a new command launches the new command, not the cached one
+        updated_server = stdio_server.model_copy(update={"command": "deno", "args": ["run", "server.ts"]})
+        assert updated_server.stdio_config["command"] == "deno"
+        assert updated_server.stdio_config["args"] == ["run", "server.ts"]
+        assert stdio_server.stdio_config["command"] == "node"
+        stdio_server.env = {"NODE_ENV": "production"}
+        assert manager._create_mcp_client(stdio_server).stdio_config["env"] == {"NODE_ENV": "production"}
+
 
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file